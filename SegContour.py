@@ -18,10 +18,34 @@ conditions, environment, and the quality of the color segmentation.
 
 """
 
-import os, cv2, numpy as np, tkinter as tk
-from scipy.signal import find_peaks
+import os, queue, shutil, subprocess, threading, multiprocessing, cv2, numpy as np, tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Numba is optional; without it, frames are thresholded and converted to 
+# grayscale with OpenCV
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# ffmpeg-python is optional; without it (or without the ffmpeg executable), 
+# output videos are written with cv2.VideoWriter
+try:
+    import ffmpeg
+except ImportError:
+    ffmpeg = None
+
+# Codecs that cv2.VideoWriter failed to open in this process while another 
+# codec succeeded; they are not retried for later videos, so OpenCV's error 
+# messages for a missing encoder are printed only once
+unavailable_codecs = set()
+
+# Whether the ffmpeg executable can encode with libx264, checked once per 
+# process by FFmpegAvailable (None until checked)
+ffmpeg_has_libx264 = None
 
 def LoadVideo(video_path: str) -> tuple[cv2.VideoCapture, int, int, int, int]:
     """
@@ -49,8 +73,50 @@ def LoadVideo(video_path: str) -> tuple[cv2.VideoCapture, int, int, int, int]:
             The total number of frames in the video.
     """
 
-    # Open the video file
-    cap = cv2.VideoCapture(video_path)
+    # Open the video file with FFmpeg, using hardware-accelerated decoding 
+    # when available
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+
+    # Fall back to the default backend if FFmpeg cannot open the video
+    if not cap.isOpened():
+        cap = cv2.VideoCapture(video_path)
+
+    # Stop if the video cannot be opened by any backend
+    if not cap.isOpened():
+        raise OSError(f"Could not open video: {video_path}")
+
+    # Keep at most one buffered frame for live sources such as cameras or 
+    # streams (ignored for video files)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    # Retrieve the video properties
+    frame_width, frame_height, fps, frame_count = GetVideoProperties(cap)
+
+    # Return the VideoCapture object and the extracted video properties
+    return cap, frame_width, frame_height, fps, frame_count
+
+def GetVideoProperties(cap: cv2.VideoCapture) -> tuple[int, int, int, int]:
+    """
+    The GetVideoProperties function retrieves the frame dimensions, frame 
+    rate, and total frame count of an opened video.
+
+    Args:
+        cap (cv2.VideoCapture):
+            A VideoCapture object opened on the video file.
+
+    Returns:
+        frame_width (int): 
+            The width of each video frame in pixels.
+
+        frame_height (int): 
+            The height of each video frame in pixels.
+
+        fps (int): 
+            The frame rate of the video (frames per second).
+
+        frame_count (int): 
+            The total number of frames in the video.
+    """
 
     # Retrieve the width of the video frames in pixels
     frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -64,18 +130,263 @@ def LoadVideo(video_path: str) -> tuple[cv2.VideoCapture, int, int, int, int]:
     # Retrieve the total number of frames in the video
     frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
-    # Return the VideoCapture object and the extracted video properties
-    return cap, frame_width, frame_height, fps, frame_count
+    # Return the extracted video properties
+    return frame_width, frame_height, fps, frame_count
+
+class FFmpegVideoWriter:
+    """
+    The FFmpegVideoWriter class encodes frames with an ffmpeg subprocess, 
+    passing the raw BGR frames through its standard input. It provides the 
+    write and release methods of cv2.VideoWriter used by MakeContouredVideo.
+
+    Methods:
+        write(frame):
+            Sends a frame to the encoder.
+
+        release():
+            Finishes encoding and waits for ffmpeg to exit.
+
+        abort():
+            Stops the encoder after an error without raising.
+    """
+
+    def __init__(self, output_video_path: str, fps: int, frame_width: int, frame_height: int):
+        """
+        Initializes the FFmpegVideoWriter class by starting ffmpeg to encode 
+        raw BGR frames to H.264.
+
+        Args:
+            output_video_path (str):
+                The path where the output video will be saved.
+
+            fps (int):
+                The frame rate of the output video (frames per second).
+
+            frame_width (int):
+                The width of each video frame in pixels.
+
+            frame_height (int):
+                The height of each video frame in pixels.
+
+        Attributes:
+            process (subprocess.Popen):
+                The ffmpeg process reading frames from its standard input.
+        """
+
+        self.process = (
+            ffmpeg
+            .input("pipe:", format="rawvideo", pix_fmt="bgr24", s=f"{frame_width}x{frame_height}", r=fps)
+            .output(output_video_path, vcodec="libx264", preset="veryfast", pix_fmt="yuv420p")
+            .global_args("-loglevel", "error")
+            .overwrite_output()
+            .run_async(pipe_stdin=True)
+        )
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Sends a frame to the encoder without copying it.
+
+        Args:
+            frame (np.ndarray):
+                The frame to write (in BGR format).
+
+        Returns:
+            None
+        """
+
+        self.process.stdin.write(np.ascontiguousarray(frame).data)
+
+    def release(self) -> None:
+        """
+        Closes the input of the encoder and waits for it to finish writing 
+        the output video.
+
+        Returns:
+            None
+        """
+
+        # Closing the input fails if ffmpeg has already exited; its exit 
+        # code is checked below
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {self.process.returncode}")
+
+    def abort(self) -> None:
+        """
+        Stops the encoder after an error. The input is closed so that 
+        ffmpeg can finish writing the frames it has received, and the 
+        process is killed if it does not exit in time. Errors are not 
+        raised, so that the original error is propagated.
+
+        Returns:
+            None
+        """
+
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+def FFmpegAvailable() -> bool:
+    """
+    The FFmpegAvailable function checks whether ffmpeg-python is installed 
+    and the ffmpeg executable on PATH was built with the libx264 encoder 
+    used by FFmpegVideoWriter. The executable is only queried the first 
+    time this is called in a process.
+
+    Returns:
+        available (bool):
+            True if output videos can be piped to ffmpeg.
+    """
+
+    global ffmpeg_has_libx264
+
+    if ffmpeg is None or not shutil.which("ffmpeg"):
+        return False
+
+    # List the encoders of the ffmpeg executable once and look for libx264
+    if ffmpeg_has_libx264 is None:
+        try:
+            result = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10)
+            ffmpeg_has_libx264 = result.returncode == 0 and "libx264" in result.stdout
+        except (OSError, subprocess.SubprocessError):
+            ffmpeg_has_libx264 = False
+
+    return ffmpeg_has_libx264
+
+def OpenVideoWriter(output_video_path: str, fps: int, frame_width: int, frame_height: int) -> cv2.VideoWriter | FFmpegVideoWriter:
+    """
+    The OpenVideoWriter function creates a writer for the output video. 
+    If ffmpeg-python and an ffmpeg executable with libx264 are available 
+    and the frame dimensions are even, frames are piped to ffmpeg. 
+    Otherwise a cv2.VideoWriter is used, preferring H.264 so that 
+    hardware encoders can be used, and falling back to MPEG-4 Part 2 
+    ('mp4v') if no H.264 encoder is available.
+
+    Args:
+        output_video_path (str):
+            The path where the output video will be saved.
+
+        fps (int):
+            The frame rate of the output video (frames per second).
+
+        frame_width (int):
+            The width of each video frame in pixels.
+
+        frame_height (int):
+            The height of each video frame in pixels.
+
+    Returns:
+        out (cv2.VideoWriter | FFmpegVideoWriter):
+            A writer object to write frames to the output video.
+    """
 
-def CalculateThreshold(video_path: str) -> tuple[int, int, int]:
+    # Pipe the frames to ffmpeg when it is available (the yuv420p output 
+    # requires even frame dimensions)
+    if FFmpegAvailable() and frame_width % 2 == 0 and frame_height % 2 == 0:
+        return FFmpegVideoWriter(output_video_path, fps, frame_width, frame_height)
+
+    # Request hardware-accelerated encoding when available
+    params = [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+
+    # Try H.264 first, then fall back to MPEG-4 Part 2, skipping codecs 
+    # already known to be unavailable
+    failed_codecs = []
+    for codec in ('avc1', 'mp4v'):
+        if codec in unavailable_codecs:
+            continue
+        fourcc = cv2.VideoWriter_fourcc(*codec)
+        out = cv2.VideoWriter(output_video_path, cv2.CAP_FFMPEG, fourcc, fps, (frame_width, frame_height), params)
+        if out.isOpened():
+            # Remember the codecs that failed, since this one could be 
+            # opened with the same path and size
+            unavailable_codecs.update(failed_codecs)
+            return out
+        failed_codecs.append(codec)
+
+    # Fall back to the default backend if FFmpeg cannot write the video
+    return cv2.VideoWriter(output_video_path, fourcc, fps, (frame_width, frame_height))
+
+def FindValleys(hist: np.ndarray, distance: int, prominence: float) -> np.ndarray:
+    """
+    The FindValleys function finds the local minima (valleys) of a 
+    histogram. It gives the same result as scipy.signal.find_peaks applied 
+    to the negated histogram with the same distance and prominence.
+
+    Args:
+        hist (np.ndarray):
+            The histogram to search.
+
+        distance (int):
+            Minimum distance in bins between neighbouring valleys. Where 
+            valleys are closer, only the deepest one is kept.
+
+        prominence (float):
+            Minimum depth of a valley relative to the lower of the highest 
+            points on either side of it before a deeper bin is reached.
+
+    Returns:
+        valleys (np.ndarray):
+            The indices of the valleys in ascending order.
+    """
+
+    hist = np.asarray(hist, dtype=np.float64).ravel()
+
+    # Collapse runs of equal values, so that a flat valley is found once
+    starts = np.flatnonzero(np.r_[True, hist[1:] != hist[:-1]])
+    ends = np.r_[starts[1:], hist.size] - 1
+    values = hist[starts]
+
+    # Find runs that are lower than both neighbouring runs, placing the 
+    # valley at the middle of the run
+    inner = (values[1:-1] < values[:-2]) & (values[1:-1] < values[2:])
+    valleys = (starts[1:-1][inner] + ends[1:-1][inner]) // 2
+
+    # Remove valleys closer than the minimum distance to a deeper valley, 
+    # starting from the deepest one (ties are visited in the same order as 
+    # in find_peaks)
+    keep = np.ones(valleys.size, dtype=bool)
+    for j in np.argsort(-hist[valleys])[::-1]:
+        if keep[j]:
+            close = np.abs(valleys - valleys[j]) < distance
+            close[j] = False
+            keep[close] = False
+    valleys = valleys[keep]
+
+    # Measure the prominence of each valley from the highest points 
+    # between it and the nearest deeper bins on either side
+    prominences = np.empty(valleys.size)
+    for k, valley in enumerate(valleys):
+        deeper_left = np.flatnonzero(hist[:valley] < hist[valley])
+        deeper_right = np.flatnonzero(hist[valley:] < hist[valley])
+        left = deeper_left[-1] + 1 if deeper_left.size else 0
+        right = valley + deeper_right[0] if deeper_right.size else hist.size
+        prominences[k] = min(hist[left:valley + 1].max(), hist[valley:right].max()) - hist[valley]
+
+    # Keep the valleys that are prominent enough
+    return valleys[prominences >= prominence]
+
+def CalculateThreshold(cap: cv2.VideoCapture) -> tuple[int, int, int]:
     """
     The CalculateThreshold function Calculate the thresholds for each 
     color channel (Blue, Green, Red) based on the average histograms of 
-    the video frames.
+    frames sampled evenly across the video. The VideoCapture is left 
+    wherever sampling stopped, so the caller must rewind it before 
+    processing the video.
 
     Args:
-        video_path (str):
-            The path to the source video.
+        cap (cv2.VideoCapture):
+            A VideoCapture object opened on the source video.
 
     Returns:
         threshold_b (int):
@@ -88,74 +399,167 @@ def CalculateThreshold(video_path: str) -> tuple[int, int, int]:
             Calculated threshold value for the Red channel.
     """
 
-    # Load the video and get the total number of frames
-    cap, _, _, _, frame_count = LoadVideo(video_path)
+    # Get the total number of frames
+    _, _, _, frame_count = GetVideoProperties(cap)
 
     # Initialize histograms for Blue, Green, and Red channels with 256 bins
+    # (float64, since the counts over a long video exceed the range that
+    # cv2.calcHist can accumulate without overflowing)
     hist_b_total = np.zeros((256, 1))
     hist_g_total = np.zeros((256, 1))
     hist_r_total = np.zeros((256, 1))
 
+    # Histogram of a single channel of one frame, reused across frames
+    hist = np.zeros((256, 1), dtype=np.float32)
+
     # Counter to track the number of processed frames
     processed_frames = 0
 
+    # Sample about 300 frames evenly across the video, which is enough for
+    # the histograms to converge
+    stride = max(1, frame_count // 300)
+
     # Loop through all frames in the video
-    for _ in range(frame_count):
-        # Read the next frame from the video
-        res, frame = cap.read()
-        if not res:
+    for i in range(frame_count):
+        # Advance to the next frame without decoding it
+        if not cap.grab():
             break
 
-        # Split the frame into Blue, Green, and Red channels
-        b, g, r = cv2.split(frame)
+        # Skip frames between samples
+        if i % stride:
+            continue
 
-        # Calculate histograms for each channel
-        hist_b = cv2.calcHist([b], [0], None, [256], [0, 256])
-        hist_g = cv2.calcHist([g], [0], None, [256], [0, 256])
-        hist_r = cv2.calcHist([r], [0], None, [256], [0, 256])
+        # Decode the sampled frame
+        res, frame = cap.retrieve()
+        if not res:
+            break
 
-        # Accumulate histograms across frames
-        hist_b_total += hist_b
-        hist_g_total += hist_g
-        hist_r_total += hist_r
+        # Calculate the histogram of each channel directly from the BGR
+        # frame and accumulate it across frames
+        hist_b_total += cv2.calcHist([frame], [0], None, [256], [0, 256], hist=hist)
+        hist_g_total += cv2.calcHist([frame], [1], None, [256], [0, 256], hist=hist)
+        hist_r_total += cv2.calcHist([frame], [2], None, [256], [0, 256], hist=hist)
 
         # Increment the number of processed frames
         processed_frames += 1
 
-    # Calculate average histograms for each channel
-    hist_b_avg = hist_b_total / processed_frames
-    hist_g_avg = hist_g_total / processed_frames
-    hist_r_avg = hist_r_total / processed_frames
+    # Stop if no frame could be decoded
+    if processed_frames == 0:
+        raise RuntimeError("Could not read any frames from the video.")
 
-    # Find peaks in the histograms for each channel
-    peaks_b, _ = find_peaks(-hist_b_avg.ravel(), distance=5, prominence=10)
-    peaks_g, _ = find_peaks(-hist_g_avg.ravel(), distance=5, prominence=10)
-    peaks_r, _ = find_peaks(-hist_r_avg.ravel(), distance=5, prominence=10)
+    # Minimum prominence of a peak in the average histogram, scaled to the
+    # accumulated histograms so they need not be averaged
+    prominence = 10 * processed_frames
 
-    # Select the 5th peak as the threshold for each channel
-    threshold_b = peaks_b[4]
-    threshold_g = peaks_g[4]
-    threshold_r = peaks_r[4]
+    # Find valleys in the histograms for each channel
+    valleys_b = FindValleys(hist_b_total, distance=5, prominence=prominence)
+    valleys_g = FindValleys(hist_g_total, distance=5, prominence=prominence)
+    valleys_r = FindValleys(hist_r_total, distance=5, prominence=prominence)
 
-    # Release the video capture object
-    cap.release()
+    # Select the 5th valley as the threshold for each channel
+    threshold_b = valleys_b[4]
+    threshold_g = valleys_g[4]
+    threshold_r = valleys_r[4]
 
     # Return the calculated thresholds for each channel
     return threshold_b, threshold_g, threshold_r
 
-def ContourExtraction(image: np.ndarray, channel: np.ndarray) -> np.ndarray:
+def CudaAvailable() -> bool:
+    """
+    The CudaAvailable function checks whether OpenCV was built with the 
+    CUDA image processing module and a CUDA-capable GPU is present.
+
+    Returns:
+        available (bool):
+            True if the CUDA Canny edge detector can be used.
+    """
+
+    try:
+        return hasattr(cv2.cuda, "createCannyEdgeDetector") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+class CudaCannyDetector:
+    """
+    The CudaCannyDetector class runs Canny edge detection on the GPU with 
+    the same thresholds as the CPU path in ContourExtraction. The GPU 
+    buffers are allocated once and reused across frames, so an instance 
+    should not be shared between threads.
+
+    Methods:
+        Detect(channel, edges=None):
+            Detects edges in a single-channel image and returns them as 
+            a NumPy array, written into edges if a buffer is given.
+    """
+
+    def __init__(self):
+        """
+        Initializes the CudaCannyDetector class by creating the CUDA Canny 
+        edge detector and the GPU buffers for its input and output.
+
+        Attributes:
+            detector (cv2.cuda.CannyEdgeDetector):
+                The CUDA Canny edge detector.
+
+            d_channel (cv2.cuda.GpuMat):
+                GPU buffer holding the input image.
+
+            d_edges (cv2.cuda.GpuMat):
+                GPU buffer holding the detected edges.
+        """
+
+        self.detector = cv2.cuda.createCannyEdgeDetector(150, 200, 3, False)
+        self.d_channel = cv2.cuda_GpuMat()
+        self.d_edges = cv2.cuda_GpuMat()
+
+    def Detect(self, channel: np.ndarray, edges: np.ndarray | None = None) -> np.ndarray:
+        """
+        Detects edges in the given single-channel image on the GPU.
+
+        Args:
+            channel (np.ndarray):
+                The single-channel grayscale image where edge detection 
+                will be applied.
+
+            edges (np.ndarray | None):
+                Optional preallocated buffer for the detected edges.
+
+        Returns:
+            edges (np.ndarray):
+                The detected edges, 255 on edge pixels and 0 elsewhere.
+        """
+
+        self.d_channel.upload(channel)
+        self.detector.detect(self.d_channel, self.d_edges)
+        return self.d_edges.download(edges)
+
+def ContourExtraction(image: np.ndarray, channel: np.ndarray, cuda_detector: CudaCannyDetector | None = None, edges: np.ndarray | None = None, edges_colored: np.ndarray | None = None) -> np.ndarray:
     """
     The ContourExtraction function extracts contours from the given image 
-    by detecting edges in the specified channel.
+    by detecting edges in the specified channel. The contours are drawn 
+    onto the input image in place.
 
     Args:
         image (np.ndarray):
-            The original input image (in BGR format).
+            The original input image (in BGR format), which is overwritten 
+            with the result.
         
         channel (np.ndarray):
             The single-channel grayscale image where edge detection will 
             be applied.
 
+        cuda_detector (CudaCannyDetector | None):
+            Optional detector used to run edge detection on the GPU. If 
+            None, edges are detected on the CPU.
+
+        edges (np.ndarray | None):
+            Optional preallocated single-channel buffer for the detected 
+            edges.
+
+        edges_colored (np.ndarray | None):
+            Optional preallocated 3-channel buffer for the edges converted 
+            to BGR.
+
     Returns:
         final_image (np.ndarray):
             The resulting image with contours overlaid on the original 
@@ -163,31 +567,83 @@ def ContourExtraction(image: np.ndarray, channel: np.ndarray) -> np.ndarray:
     """
 
     # Apply Canny edge detection on the specified channel
-    edges = cv2.Canny(channel, 150, 200)
+    if cuda_detector is None:
+        edges = cv2.Canny(channel, 150, 200, edges)
+    else:
+        edges = cuda_detector.Detect(channel, edges)
 
     # Convert the edges to a 3-channel (BGR) image for overlaying
-    edges_colored = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
-
-    # Create an overlay by replacing edge pixels with white (255, 255, 255)
-    overlay = np.where(edges_colored == 255, (255, 255, 255), image)
-
-    # Ensure the overlay is in the correct data type for OpenCV operations
-    overlay = overlay.astype(np.uint8)
+    edges_colored = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR, dst=edges_colored)
 
-    # Blend the original image and the overlay to create the final image
-    final_image = cv2.addWeighted(image, 0, overlay, 1, 0)
+    # Turn edge pixels white (255, 255, 255); since the edges are either 0 or
+    # 255, OR-ing them into the image leaves all other pixels unchanged
+    final_image = cv2.bitwise_or(image, edges_colored, dst=image)
 
     # Return the final image with contours
     return final_image
 
-def MakeContouredVideo(video_path: str, output_video_path: str, threshold_b: int, threshold_g: int, threshold_r: int, progress_callback: function) -> None:
+def ThresholdGrayscale(frame: np.ndarray, threshold_b: int, threshold_g: int, threshold_r: int, gray: np.ndarray) -> None:
+    """
+    The ThresholdGrayscale function thresholds each color channel of the 
+    given frame and converts the result to grayscale in a single pass over 
+    the pixels. The output matches thresholding the channels followed by 
+    cv2.cvtColor with cv2.COLOR_BGR2GRAY.
+
+    Args:
+        frame (np.ndarray):
+            The input frame (in BGR format).
+
+        threshold_b (int):
+            Threshold value for the Blue channel.
+
+        threshold_g (int):
+            Threshold value for the Green channel.
+
+        threshold_r (int):
+            Threshold value for the Red channel.
+
+        gray (np.ndarray):
+            The single-channel output image, with the same height and 
+            width as the frame.
+
+    Returns:
+        None
+    """
+
+    for y in range(frame.shape[0]):
+        for x in range(frame.shape[1]):
+            b = np.int32(frame[y, x, 0])
+            g = np.int32(frame[y, x, 1])
+            r = np.int32(frame[y, x, 2])
+
+            # Set values at or above each channel's threshold to 255
+            if b >= threshold_b:
+                b = 255
+            if g >= threshold_g:
+                g = 255
+            if r >= threshold_r:
+                r = 255
+
+            # Weight the channels with OpenCV's fixed-point luminance 
+            # coefficients (0.114, 0.587, 0.299 scaled by 2^15)
+            gray[y, x] = (b * 3735 + g * 19235 + r * 9798 + 16384) >> 15
+
+# Compile the function when Numba is available; nogil lets the worker 
+# threads in MakeContouredVideo run it concurrently
+ThresholdGrayscale = njit(nogil=True, cache=True)(ThresholdGrayscale) if njit else None
+
+def MakeContouredVideo(cap: cv2.VideoCapture, output_video_path: str, threshold_b: int, threshold_g: int, threshold_r: int, progress_callback: Callable[[int, int], None], num_workers: int | None = None) -> None:
     """
     The MakeContouredVideo function processes a video to generate contours 
-    based on thresholds and save the output.
+    based on thresholds and save the output. Decoding, contour extraction, 
+    and encoding run concurrently: a reader thread decodes frames, a pool 
+    of worker threads processes them, and the calling thread writes the 
+    results in their original order.
 
     Args:
-        video_path (str):
-            The path to the input video.
+        cap (cv2.VideoCapture):
+            A VideoCapture object opened on the input video, positioned at 
+            its first frame. It is not released by this function.
         
         output_video_path (str):
             The path where the processed video with contours will be saved.
@@ -201,54 +657,214 @@ def MakeContouredVideo(video_path: str, output_video_path: str, threshold_b: int
         threshold_r (int):
             Threshold value for the Red channel.
 
-        progress_callback (function):
+        progress_callback (Callable[[int, int], None]):
             A callback function to update progress, accepting current 
             frame and total frames as arguments.
+
+        num_workers (int | None):
+            Number of threads processing frames. If None, all but two of 
+            the CPU cores are used, leaving them for decoding and encoding.
     
     Returns:
         None
     """
 
-    # Load the video and retrieve its properties
-    cap, frame_width, frame_height, fps, frame_count = LoadVideo(video_path)
-
-    # Define the codec and create a VideoWriter object for the output video
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(output_video_path, fourcc, fps, (frame_width, frame_height))
-
-    # Process each frame in the video
-    for i in range(frame_count):
-        # Read the next frame from the video
-        res, frame = cap.read()
-        if not res:
-            break
+    # Retrieve the properties of the video
+    frame_width, frame_height, fps, frame_count = GetVideoProperties(cap)
+
+    # Build a per-channel lookup table that sets values at or above each
+    # channel's threshold to 255 and leaves the others unchanged
+    values = np.arange(256)
+    lut = np.stack([
+        np.where(values >= threshold, 255, values).astype(np.uint8)
+        for threshold in (threshold_b, threshold_g, threshold_r)
+    ], axis=-1).reshape(256, 1, 3)
+
+    # Number of threads processing frames, by default leaving cores free 
+    # for decoding and encoding
+    if num_workers is None:
+        num_workers = max(1, (os.cpu_count() or 1) - 2)
+
+    # Maximum number of frames being processed at the same time
+    max_pending = 2 * num_workers
+
+    # Bounded queue of decoded frames passed from the reader to the workers
+    decoded_frames = queue.Queue(maxsize=8)
+
+    # Event used to stop the reader early if processing fails
+    stop_reading = threading.Event()
+
+    # Per-thread buffers reused across frames
+    buffers = threading.local()
+
+    # Run edge detection on the GPU when one is available
+    use_cuda = CudaAvailable()
+
+    # Define the function to decode the frames of the video
+    def ReadFrames():
+        try:
+            for _ in range(frame_count):
+                # Read the next frame from the video
+                if stop_reading.is_set() or not cap.grab():
+                    break
+                res, frame = cap.retrieve()
+                if not res:
+                    break
+
+                decoded_frames.put(frame)
+        finally:
+            # Mark the end of the video
+            decoded_frames.put(None)
+
+    # Define the function to generate the final frame from a decoded frame
+    def ProcessFrame(frame: np.ndarray) -> np.ndarray:
+        # Allocate the buffers on the first frame of this thread
+        if not hasattr(buffers, "gray"):
+            buffers.merged_image = np.empty((frame_height, frame_width, 3), dtype=np.uint8) if ThresholdGrayscale is None else None
+            buffers.gray = np.empty((frame_height, frame_width), dtype=np.uint8)
+            buffers.edges = np.empty((frame_height, frame_width), dtype=np.uint8)
+            buffers.edges_colored = np.empty((frame_height, frame_width, 3), dtype=np.uint8)
+
+            # Create the GPU edge detector when CUDA is used
+            buffers.cuda_detector = CudaCannyDetector() if use_cuda else None
+
+        if ThresholdGrayscale is not None:
+            # Threshold each channel and convert to grayscale in one pass
+            ThresholdGrayscale(frame, threshold_b, threshold_g, threshold_r, buffers.gray)
+        else:
+            # Apply thresholding to each channel in a single pass
+            cv2.LUT(frame, lut, dst=buffers.merged_image)
+
+            # Convert the merged image to grayscale for contour extraction
+            cv2.cvtColor(buffers.merged_image, cv2.COLOR_BGR2GRAY, dst=buffers.gray)
 
-        # Split the frame into Blue, Green, and Red channels
-        b, g, r = cv2.split(frame)
-
-        # Apply thresholding to each channel
-        b[b >= threshold_b] = 255
-        g[g >= threshold_g] = 255
-        r[r >= threshold_r] = 255
+        # Extract contours and generate the final frame
+        return ContourExtraction(frame, buffers.gray, buffers.cuda_detector, buffers.edges, buffers.edges_colored)
+
+    # Create a VideoWriter object for the output video
+    out = OpenVideoWriter(output_video_path, fps, frame_width, frame_height)
+
+    # Whether all frames were written without an error
+    completed = False
+
+    try:
+        with ThreadPoolExecutor(max_workers=num_workers + 1) as executor:
+            reader = executor.submit(ReadFrames)
+
+            # Frames submitted for processing, in their original order
+            pending = deque()
+            written_frames = 0
+
+            try:
+                while True:
+                    frame = decoded_frames.get()
+                    end_of_video = frame is None
+                    if not end_of_video:
+                        pending.append(executor.submit(ProcessFrame, frame))
+
+                    # Write finished frames in order, waiting for the oldest one
+                    # when too many are in flight or the video has ended
+                    while pending and (end_of_video or len(pending) >= max_pending or pending[0].done()):
+                        # Write the processed frame to the output video
+                        out.write(pending.popleft().result())
+                        written_frames += 1
+
+                        # Update progress using the callback function
+                        progress_callback(written_frames, frame_count)
+
+                    if end_of_video:
+                        break
+
+                # Propagate any error raised while decoding
+                reader.result()
+            finally:
+                # Stop the reader and unblock it if it is waiting on a full queue
+                stop_reading.set()
+                while not reader.done():
+                    try:
+                        decoded_frames.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+
+        completed = True
+    finally:
+        # Release the video writer resources, stopping ffmpeg without 
+        # raising over the original error if processing failed
+        if completed or not isinstance(out, FFmpegVideoWriter):
+            out.release()
+        else:
+            out.abort()
+
+def ProcessVideo(video_path: str, output_video_folder: str, progress_queue: queue.Queue, num_workers: int) -> None:
+    """
+    The ProcessVideo function calculates the thresholds of a video and 
+    saves its contoured version to the output directory. It runs in a 
+    worker process, so progress is reported through a queue rather than 
+    a callback.
 
-        # Merge the thresholded channels back into a single image
-        merged_image = cv2.merge((b, g, r))
+    Args:
+        video_path (str):
+            The path to the input video.
 
-        # Convert the merged image to grayscale for contour extraction
-        gray = cv2.cvtColor(merged_image, cv2.COLOR_BGR2GRAY)
+        output_video_folder (str):
+            The directory where the processed video will be saved.
 
-        # Extract contours and generate the final frame
-        final_frame = ContourExtraction(frame, gray)
+        progress_queue (queue.Queue):
+            A queue shared with the GUI process that receives tuples of 
+            (video path, current frame, total frames).
 
-        # Write the processed frame to the output video
-        out.write(final_frame)
+        num_workers (int):
+            Number of threads processing the frames of the video, sized so 
+            that the videos processed in parallel share the CPU cores.
 
-        # Update progress using the callback function
-        progress_callback(i + 1, frame_count)
+    Returns:
+        None
+    """
 
-    # Release the video capture and writer resources
-    cap.release()
-    out.release()
+    video_name = os.path.basename(video_path)
+
+    # Define the output path for the processed video
+    output_video_path = os.path.join(output_video_folder, f"processed_{video_name}")
+
+    # Open the video once for both the threshold and contour passes, 
+    # reopening it only if it cannot be rewound in between
+    cap, _, _, _, _ = LoadVideo(video_path)
+
+    try:
+        # Calculate the threshold values for each color channel (B, G, R)
+        threshold_b, threshold_g, threshold_r = CalculateThreshold(cap)
+
+        # Rewind the video to its first frame; some backends cannot seek 
+        # or land on a different frame, so reopen the video in that case
+        if not cap.set(cv2.CAP_PROP_POS_FRAMES, 0) or cap.get(cv2.CAP_PROP_POS_FRAMES) != 0:
+            cap.release()
+            cap, _, _, _, _ = LoadVideo(video_path)
+
+        # Percentage of the video last reported to the GUI process
+        last_percentage = -1
+
+        # Define the function to send progress updates to the GUI process, 
+        # only when the integer percentage changes
+        def ReportProgress(current_frame: int, total_frames: int):
+            nonlocal last_percentage
+            percentage = current_frame * 100 // total_frames
+            if percentage != last_percentage:
+                last_percentage = percentage
+                progress_queue.put((video_path, current_frame, total_frames))
+
+        # Process the video and apply contours
+        MakeContouredVideo(
+            cap,
+            output_video_path,
+            threshold_b,
+            threshold_g,
+            threshold_r,
+            ReportProgress,
+            num_workers
+        )
+    finally:
+        # Release the video capture resources
+        cap.release()
 
 # The GUI class definition
 class SegContourGUI:
@@ -272,9 +888,9 @@ class SegContourGUI:
             Opens a file dialog to select an output directory and 
             updates the listbox with the selected directory path.
 
-        UpdateProgress(video_name, current_frame, total_frames):
-            Updates the progress bar and label to reflect the current frame 
-            during video processing.
+        UpdateProgress(finished_videos, total_videos, progress_percentage):
+            Updates the progress bar and label to reflect the combined 
+            progress of the videos being processed.
 
         ShowProgressWidgets():
             Displays the progress bar and label during video processing.
@@ -284,8 +900,8 @@ class SegContourGUI:
             canceled.
 
         StartProcessing():
-            Validates input and output paths, then starts the video processing 
-            operation in a separate thread to keep the GUI responsive.
+            Validates input and output paths, then starts processing the 
+            videos in parallel worker processes to keep the GUI responsive.
     """
 
     def __init__(self, root):
@@ -460,29 +1076,28 @@ class SegContourGUI:
             else:
                 self.output_scroll_x.grid_remove()
 
-    def UpdateProgress(self, video_name: str, current_frame: int, total_frames: int):
+    def UpdateProgress(self, finished_videos: int, total_videos: int, progress_percentage: float):
         """
-        Updates the progress bar and label to reflect the current frame 
-        during video processing.
+        Updates the progress bar and label to reflect the combined progress 
+        of the videos being processed. Must be called from the GUI thread; 
+        Tk redraws the widgets on its next idle cycle.
 
         Args:
-            video_name (str):
-                The name of the currently processed video.
+            finished_videos (int):
+                The number of videos that have been processed.
 
-            current_frame (int):
-                The current frame being processed.
+            total_videos (int):
+                The total number of videos to process.
                 
-            total_frames (int):
-                The total number of frames in the video.
+            progress_percentage (float):
+                The combined progress of all videos, in percent.
 
         Returns:
             None
         """
 
-        progress_percentage = (current_frame / total_frames) * 100
         self.progress_bar["value"] = progress_percentage
-        self.progress_label.config(text=f"Processing {video_name}: Frame {current_frame}/{total_frames}")
-        self.root.update_idletasks()
+        self.progress_label.config(text=f"Processing videos: {finished_videos}/{total_videos} done ({progress_percentage:.0f}%)")
 
     def ShowProgressWidgets(self):
         """
@@ -510,9 +1125,10 @@ class SegContourGUI:
     def StartProcessing(self):
         """
         Validates whether input videos and an output directory are selected, 
-        and starts the video processing operation in a separate thread to 
-        keep the GUI responsive. If the input or output is missing, an error 
-        message is displayed.
+        and starts processing the videos in a pool of worker processes, one 
+        video per process. Progress updates from the workers are polled 
+        periodically on the GUI thread to keep the GUI responsive. If the 
+        input or output is missing, an error message is displayed.
 
         Returns:
             None
@@ -533,40 +1149,76 @@ class SegContourGUI:
             messagebox.showerror("Error", "Please select an output folder.")
             return
 
+        # Check that no two input videos would be saved to the same output 
+        # file, since they are processed at the same time
+        video_names = [os.path.basename(video_path) for video_path in video_paths]
+        duplicate_names = sorted({name for name in video_names if video_names.count(name) > 1})
+        if duplicate_names:
+            messagebox.showerror("Error", f"Input videos must have different file names: {', '.join(duplicate_names)}")
+            return
+
         # Show the progress bar and label while processing
         self.ShowProgressWidgets()
 
-        # Define the function to process the videos
-        def ProcessVideos():
-            for video_path in video_paths:
-                video_name = os.path.basename(video_path)
-
-                # Define the output path for the processed video
-                output_video_path = os.path.join(output_video_folder, f"processed_{video_name}")
-
-                # Calculate the threshold values for each color channel (B, G, R)
-                threshold_b, threshold_g, threshold_r = CalculateThreshold(video_path)
-
-                # Process the video and apply contours
-                MakeContouredVideo(
-                    video_path,
-                    output_video_path,
-                    threshold_b,
-                    threshold_g,
-                    threshold_r,
-                    # Update progress during processing
-                    lambda current_frame, total_frames: self.UpdateProgress(video_name, current_frame, total_frames)
-                )
+        # Queue shared with the worker processes for progress updates
+        manager = multiprocessing.Manager()
+        progress_queue = manager.Queue()
+
+        # Process the videos in parallel, leaving cores free for the threads 
+        # used within each video
+        max_workers = min(len(video_paths), max(1, (os.cpu_count() or 1) // 2))
+
+        # Split the cores between the videos, leaving one per video for 
+        # decoding and encoding
+        num_workers = max(1, (os.cpu_count() or 1) // max_workers - 1)
+
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        futures = [
+            executor.submit(ProcessVideo, video_path, output_video_folder, progress_queue, num_workers)
+            for video_path in video_paths
+        ]
+
+        # Fraction of each video processed so far, by video path
+        video_progress = dict.fromkeys(video_paths, 0.0)
+
+        # Define the function to poll the progress of the workers
+        def PollProgress():
+            # Apply the progress updates received since the last poll
+            while True:
+                try:
+                    video_path, current_frame, total_frames = progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                video_progress[video_path] = current_frame / total_frames
+
+            # Show the combined progress, weighting each video equally so 
+            # that it does not move backwards when a video starts
+            finished_videos = sum(future.done() for future in futures)
+            progress_percentage = sum(video_progress.values()) / len(video_progress) * 100
+            self.UpdateProgress(finished_videos, len(futures), progress_percentage)
+
+            # Poll again later while any video is still being processed
+            if not all(future.done() for future in futures):
+                self.root.after(50, PollProgress)
+                return
+
+            # Release the worker processes
+            executor.shutdown()
+            manager.shutdown()
 
             # Hide the progress bar and label after processing
             self.HideProgressWidgets()
 
+            # Show an error message if any video failed to process
+            errors = [future.exception() for future in futures if future.exception() is not None]
+            if errors:
+                messagebox.showerror("Error", f"{len(errors)} video(s) could not be processed: {errors[0]}")
+                return
+
             # Show a success message when all videos have been processed
             messagebox.showinfo("Info", "All videos have been processed successfully.")
 
-        # Run the video processing operation in a separate thread to keep the GUI responsive
-        executor = ThreadPoolExecutor(max_workers=1)
-        executor.submit(ProcessVideos)
+        self.root.after(50, PollProgress)
 
 if __name__ == "__main__":
     root = tk.Tk()